@@ -10,6 +10,7 @@
 # file in the root of the project for the full license.             #
 #                                                                   #
 #####################################################################
+import os
 import labscript_utils.h5_lock
 import h5py
 from labscript_utils import dedent
@@ -19,6 +20,35 @@ from .utils import split_conn_AO, split_conn_DO
 from . import models
 import warnings
 
+# Wait monitor attributes of connection tables that have already been read, as
+# {filepath: (mtime, wait_attrs)}. A recompiled connection table is read afresh:
+_WAITS_CACHE = {}
+
+_WAIT_ATTR_NAMES = (
+    'wait_monitor_acquisition_device',
+    'wait_monitor_acquisition_connection',
+    'wait_monitor_timeout_device',
+    'wait_monitor_timeout_connection',
+)
+
+
+def _get_wait_attrs(filepath):
+    """Return a new dict of the wait monitor attributes of the connection table at
+    filepath, reading the file only if it has not already been read since it was last
+    modified"""
+    mtime = os.stat(filepath).st_mtime_ns
+    cached = _WAITS_CACHE.get(filepath)
+    if cached is not None and cached[0] == mtime:
+        return dict(cached[1])
+    with h5py.File(filepath, 'r') as f:
+        waits = f['waits']
+        wait_attrs = {name: waits.attrs[name] for name in _WAIT_ATTR_NAMES}
+        wait_attrs['wait_monitor_timeout_trigger_type'] = waits.attrs.get(
+            'wait_monitor_timeout_trigger_type', 'rising'
+        )
+    _WAITS_CACHE[filepath] = (mtime, wait_attrs)
+    return dict(wait_attrs)
+
 
 class NI_DAQmxTab(DeviceTab):
     def initialise_GUI(self):
@@ -80,7 +110,7 @@ class NI_DAQmxTab(DeviceTab):
         # Create output objects:
         AO_prop = {}
         for i in range(num_AO):
-            AO_prop['ao%d' % i] = {
+            AO_prop[f'ao{i}'] = {
                 'base_unit': AO_base_units,
                 'min': AO_base_min,
                 'max': AO_base_max,
@@ -91,13 +121,14 @@ class NI_DAQmxTab(DeviceTab):
         DO_proplist = []
         DO_hardware_names = []
         for port_num in range(len(ports)):
-            port_str ='port%d' % port_num
-            port_props = {}
-            for line in range(ports[port_str]['num_lines']):
-                hardware_name = 'port%d/line%d' % (port_num, line)
-                port_props[hardware_name] = {}
-                DO_hardware_names.append(hardware_name)
-            DO_proplist.append((port_str, port_props))
+            port_str = f'port{port_num}'
+            port = ports[port_str]
+            hardware_names = [
+                f'port{port_num}/line{line}' for line in range(port['num_lines'])
+            ]
+            DO_hardware_names.extend(hardware_names)
+            DO_props = {name: {} for name in hardware_names}
+            DO_proplist.append((port_str, DO_props, port['supports_buffered']))
 
         # Create the output objects
         self.create_analog_outputs(AO_prop)
@@ -106,21 +137,20 @@ class NI_DAQmxTab(DeviceTab):
         _, AO_widgets, _ = self.auto_create_widgets()
 
         # now create the digital output objects one port at a time
-        for _, DO_prop in DO_proplist:
+        for _, DO_prop, _ in DO_proplist:
             self.create_digital_outputs(DO_prop)
 
         # Manually create the digital output widgets so they are grouped separately
         DO_widgets_by_port = {}
-        for port_str, DO_prop in DO_proplist:
+        for port_str, DO_prop, _ in DO_proplist:
             DO_widgets_by_port[port_str] = self.create_digital_widgets(DO_prop)
 
         # Auto place the widgets in the UI, specifying sort keys for ordering them:
         widget_list = [("Analog outputs", AO_widgets, split_conn_AO)]
-        for port_num in range(len(ports)):
-            port_str ='port%d' % port_num
+        for port_str, _, supports_buffered in DO_proplist:
             DO_widgets = DO_widgets_by_port[port_str]
-            name = "Digital outputs: %s" % port_str
-            if ports[port_str]['supports_buffered']:
+            name = f"Digital outputs: {port_str}"
+            if supports_buffered:
                 name += ' (buffered)'
             else:
                 name += ' (static)'
@@ -129,16 +159,12 @@ class NI_DAQmxTab(DeviceTab):
 
         # We only need a wait monitor worker if we are if fact the device with
         # the wait monitor input.
-        with h5py.File(connection_table.filepath, 'r') as f:
-            waits = f['waits']
-            wait_acq_device = waits.attrs['wait_monitor_acquisition_device']
-            wait_acq_connection = waits.attrs['wait_monitor_acquisition_connection']
-            wait_timeout_device = waits.attrs['wait_monitor_timeout_device']
-            wait_timeout_connection = waits.attrs['wait_monitor_timeout_connection']
-            try:
-                timeout_trigger_type = waits.attrs['wait_monitor_timeout_trigger_type']
-            except KeyError:
-                timeout_trigger_type = 'rising'
+        wait_attrs = _get_wait_attrs(connection_table.filepath)
+        wait_acq_device = wait_attrs['wait_monitor_acquisition_device']
+        wait_acq_connection = wait_attrs['wait_monitor_acquisition_connection']
+        wait_timeout_device = wait_attrs['wait_monitor_timeout_device']
+        wait_timeout_connection = wait_attrs['wait_monitor_timeout_connection']
+        timeout_trigger_type = wait_attrs['wait_monitor_timeout_trigger_type']
 
         # Create and set the primary worker
         self.create_worker(